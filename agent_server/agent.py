@@ -1,7 +1,8 @@
+import asyncio
 from typing import AsyncGenerator
 
 import mlflow
-from agents import Agent, Runner, set_default_openai_api, set_default_openai_client
+from agents import Agent, ModelSettings, Runner, set_default_openai_api, set_default_openai_client
 from agents.tracing import set_trace_processors
 from databricks_openai import AsyncDatabricksOpenAI
 from databricks_openai.agents import McpServer
@@ -12,8 +13,10 @@ from mlflow.types.responses import (
     ResponsesAgentStreamEvent,
 )
 
+from agent_server.mcp_session import SharedMcpServer, is_mcp_session_error
 from agent_server.utils import (
     get_user_workspace_client,
+    get_workspace_client,
     process_agent_stream_events, build_mcp_url,
 )
 
@@ -24,41 +27,96 @@ set_trace_processors([])  # only use mlflow for trace processing
 mlflow.openai.autolog()
 
 
-async def init_mcp_server():
+def use_eager_task_factory():
+    # Python 3.12+ can run new tasks inline until their first real suspension, which
+    # skips a scheduling round-trip for the many short tasks spawned per request
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
+def build_mcp_server() -> McpServer:
+    workspace_client = get_workspace_client()
     return McpServer(
-        url=build_mcp_url("/api/2.0/mcp/functions/system/ai"),
+        url=build_mcp_url("/api/2.0/mcp/functions/system/ai", workspace_client),
         name="system.ai UC function MCP server",
+        # Reuse the process-wide client instead of letting the server build its own
+        workspace_client=workspace_client,
     )
 
 
+async def init_mcp_server():
+    # Resolving the workspace client's config and auth is blocking I/O, keep all of it off the loop
+    return await asyncio.to_thread(build_mcp_server)
+
+
+# Don't interpolate per-request values here; the serving endpoint's prefix cache relies on the
+# system prompt staying the same across requests
+AGENT_INSTRUCTIONS = "You are a code execution agent. You can execute code and return the results."
+
+
 def create_coding_agent(mcp_server: McpServer) -> Agent:
     return Agent(
         name="Code execution agent",
-        instructions="You are a code execution agent. You can execute code and return the results.",
+        instructions=AGENT_INSTRUCTIONS,
         model="databricks-gpt-5-2",
         mcp_servers=[mcp_server],
+        # Let the model emit independent tool calls in one turn; the runner executes them concurrently
+        model_settings=ModelSettings(parallel_tool_calls=True),
     )
 
 
+_cached_agent: tuple[McpServer, Agent] | None = None
+
+
+def get_coding_agent(mcp_server: McpServer) -> Agent:
+    # Agents are immutable configuration, so build one per MCP session rather than per request
+    global _cached_agent
+    if _cached_agent is None or _cached_agent[0] is not mcp_server:
+        _cached_agent = (mcp_server, create_coding_agent(mcp_server))
+    return _cached_agent[1]
+
+
+def to_input_items(request: ResponsesAgentRequest) -> list[dict]:
+    # Null optional fields are dropped. exclude_unset is deliberately not used: it would also drop
+    # fields that are only present as model defaults, such as an item's `type`, which the
+    # Runner relies on to tell messages apart from function calls and their outputs.
+    return [i.model_dump(exclude_none=True) for i in request.input]
+
+
+shared_mcp_server = SharedMcpServer(init_mcp_server)
+
+
 @invoke()
 async def invoke(request: ResponsesAgentRequest) -> ResponsesAgentResponse:
     # Optionally use the user's workspace client for on-behalf-of authentication
     # user_workspace_client = get_user_workspace_client()
-    async with await init_mcp_server() as mcp_server:
-        agent = create_coding_agent(mcp_server)
-        messages = [i.model_dump() for i in request.input]
+    mcp_server = await shared_mcp_server.get()
+    try:
+        agent = get_coding_agent(mcp_server)
+        messages = to_input_items(request)
         result = await Runner.run(agent, messages)
         return ResponsesAgentResponse(output=[item.to_input_item() for item in result.new_items])
+    except Exception as e:
+        # Other requests share this session, so only drop it when the connection itself failed
+        if is_mcp_session_error(e):
+            await shared_mcp_server.reset(mcp_server)
+        raise
 
 
 @stream()
 async def stream(request: dict) -> AsyncGenerator[ResponsesAgentStreamEvent, None]:
     # Optionally use the user's workspace client for on-behalf-of authentication
     # user_workspace_client = get_user_workspace_client()
-    async with await init_mcp_server() as mcp_server:
-        agent = create_coding_agent(mcp_server)
-        messages = [i.model_dump() for i in request.input]
+    mcp_server = await shared_mcp_server.get()
+    try:
+        agent = get_coding_agent(mcp_server)
+        messages = to_input_items(request)
         result = Runner.run_streamed(agent, input=messages)
 
         async for event in process_agent_stream_events(result.stream_events()):
             yield event
+    except Exception as e:
+        if is_mcp_session_error(e):
+            await shared_mcp_server.reset(mcp_server)
+        raise
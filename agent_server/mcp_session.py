@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+import anyio
+import httpx
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS, METHOD_NOT_FOUND
+
+if TYPE_CHECKING:
+    from databricks_openai.agents import McpServer
+
+# Failures that mean the MCP connection itself is gone (dropped transport, expired or terminated
+# session), as opposed to a model, max-turns or tool error that only affects one turn
+MCP_SESSION_ERRORS = (
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+# An idle session may have expired server-side, so ping it before reuse after this long
+MCP_IDLE_CHECK_SECONDS = 60.0
+MCP_PING_TIMEOUT_SECONDS = 5.0
+# Closing runs under the lock, so a hung close must not block every other request
+MCP_CLOSE_TIMEOUT_SECONDS = 10.0
+
+
+def is_mcp_session_error(error: BaseException) -> bool:
+    # The agents SDK re-raises tool call failures wrapped in its own exceptions and the MCP
+    # client surfaces task group failures as exception groups, so look through both
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, MCP_SESSION_ERRORS):
+            return True
+        if isinstance(current, McpError):
+            # Bad tool names or arguments from the model are the turn's problem, not the session's
+            return current.error.code not in (INVALID_PARAMS, METHOD_NOT_FOUND)
+        if isinstance(current, BaseExceptionGroup):
+            return any(is_mcp_session_error(e) for e in current.exceptions)
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class SharedMcpServer:
+    """Keeps one connected MCP server per event loop so requests don't reconnect each turn."""
+
+    def __init__(self, init_server: Callable[[], Awaitable[McpServer]]):
+        self._init_server = init_server
+        self._server: McpServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._closed: asyncio.Event | None = None
+        self._holder: asyncio.Task | None = None
+        self._last_used = 0.0
+
+    async def _hold(self, ready: asyncio.Future, closed: asyncio.Event):
+        # The MCP client must be entered and exited from the same task, so a dedicated
+        # task owns the connection for its whole lifetime
+        try:
+            async with await self._init_server() as server:
+                if ready.cancelled():
+                    # The caller gave up while we were connecting, close right away
+                    return
+                ready.set_result(server)
+                await closed.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not ready.cancelled():
+                logging.warning(f"Error closing MCP server: {e}")
+
+    async def _open(self) -> McpServer:
+        ready = asyncio.get_running_loop().create_future()
+        self._closed = asyncio.Event()
+        self._holder = asyncio.create_task(self._hold(ready, self._closed))
+        self._server = await ready
+        self._last_used = time.monotonic()
+        return self._server
+
+    async def _close(self):
+        holder, closed = self._holder, self._closed
+        self._holder, self._server = None, None
+        if holder is not None:
+            closed.set()
+            try:
+                await asyncio.wait_for(holder, MCP_CLOSE_TIMEOUT_SECONDS)
+            except TimeoutError:
+                # wait_for has cancelled the holder, which abandons the connection
+                logging.warning("Timed out closing MCP server")
+
+    async def _is_alive(self, server: McpServer) -> bool:
+        session = getattr(server, "session", None)
+        if session is None:
+            return False
+        try:
+            await asyncio.wait_for(session.send_ping(), MCP_PING_TIMEOUT_SECONDS)
+        except Exception:
+            return False
+        return True
+
+    def _is_idle(self) -> bool:
+        return time.monotonic() - self._last_used > MCP_IDLE_CHECK_SECONDS
+
+    async def get(self) -> McpServer:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A session opened on another loop (e.g. asyncio.run per eval row) can't be reused
+            self._server, self._holder, self._loop, self._lock = None, None, loop, asyncio.Lock()
+        server = self._server
+        if server is None or self._is_idle():
+            async with self._lock:
+                if self._server is None:
+                    await self._open()
+                elif self._server is server and self._is_idle():
+                    # Reconnect here rather than letting the user's turn hit an expired session
+                    if await self._is_alive(server):
+                        self._last_used = time.monotonic()
+                    else:
+                        await self._close()
+                        await self._open()
+                server = self._server
+        self._last_used = time.monotonic()
+        return server
+
+    async def reset(self, server: McpServer):
+        """Drop the session after a connection failure, unless it was already replaced."""
+        if self._lock is None:
+            return
+        async with self._lock:
+            if self._server is server:
+                await self._close()
+
+    async def close(self):
+        """Close the session held on the running loop, e.g. at app shutdown."""
+        if self._lock is None or self._loop is not asyncio.get_running_loop():
+            return
+        async with self._lock:
+            await self._close()
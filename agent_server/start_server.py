@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from mlflow.genai.agent_server import AgentServer, setup_mlflow_git_based_version_tracking
 
@@ -6,10 +8,27 @@ load_dotenv(dotenv_path=".env", override=True)
 
 # Need to import the agent to register the functions with the server
 import agent_server.agent  # noqa: E402
+from agent_server.agent import shared_mcp_server, use_eager_task_factory  # noqa: E402
 
 agent_server = AgentServer("ResponsesAgent", enable_chat_proxy=True)
 # Define the app as a module level variable to enable multiple workers
 app = agent_server.app  # noqa: F841
+
+_server_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Runs once on each worker's event loop, wrapping whatever lifespan the server already has
+    use_eager_task_factory()
+    async with _server_lifespan(app) as state:
+        try:
+            yield state
+        finally:
+            await shared_mcp_server.close()
+
+
+app.router.lifespan_context = lifespan
 setup_mlflow_git_based_version_tracking()
 
 
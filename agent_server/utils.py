@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from functools import lru_cache
 from typing import AsyncGenerator, AsyncIterator, Optional
 from uuid import uuid4
 
@@ -8,8 +10,14 @@ from mlflow.genai.agent_server import get_request_headers
 from mlflow.types.responses import ResponsesAgentStreamEvent
 
 
+@lru_cache(maxsize=1)
+def get_workspace_client() -> WorkspaceClient:
+    # Resolving config and auth is not free, so share one client per process
+    return WorkspaceClient()
+
+
 def get_databricks_host(workspace_client: WorkspaceClient | None = None) -> Optional[str]:
-    workspace_client = workspace_client or WorkspaceClient()
+    workspace_client = workspace_client or get_workspace_client()
     try:
         return workspace_client.config.host
     except Exception as e:
@@ -36,11 +44,21 @@ async def process_agent_stream_events(
     async for event in async_stream:
         if event.type == "raw_response_event":
             event_data = event.data.model_dump()
-            if event_data["type"] == "response.output_item.added":
+            event_type = event_data["type"]
+            # Text deltas are the bulk of the stream and only ever carry item_id
+            if event_type == "response.output_text.delta":
+                event_data["item_id"] = curr_item_id
+                yield event_data
+                # Deltas that arrive already buffered never suspend, so hand the loop to other
+                # streams between tokens instead of draining a whole burst in one go
+                await asyncio.sleep(0)
+                continue
+            item = event_data.get("item")
+            if event_type == "response.output_item.added":
                 curr_item_id = str(uuid4())
-                event_data["item"]["id"] = curr_item_id
-            elif event_data.get("item") is not None and event_data["item"].get("id") is not None:
-                event_data["item"]["id"] = curr_item_id
+                item["id"] = curr_item_id
+            elif item is not None and item.get("id") is not None:
+                item["id"] = curr_item_id
             elif event_data.get("item_id") is not None:
                 event_data["item_id"] = curr_item_id
             yield event_data
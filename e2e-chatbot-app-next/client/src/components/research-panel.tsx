@@ -69,7 +69,10 @@ export function ResearchPanel({ chatId }: { chatId: string }) {
       return;
     }
 
-    const latestSeq = events.at(-1)?.seq ?? 0;
+    // The list may still hold the previous run's events until the new run's
+    // history loads, and seq restarts per run, so only resume from our own run
+    const lastEvent = events.at(-1);
+    const latestSeq = lastEvent?.runId === runId ? lastEvent.seq : 0;
     const streamUrl = `/api/research/projects/${projectId}/runs/${runId}/events/stream?after_seq=${latestSeq}`;
     const source = new EventSource(streamUrl);
 
@@ -77,7 +80,14 @@ export function ResearchPanel({ chatId }: { chatId: string }) {
       try {
         const parsed = JSON.parse(event.data) as ResearchRunEvent;
         setEvents((prev) => {
-          if (prev.some((existing) => existing.id === parsed.id)) {
+          // Events arrive in seq order, so anything at or below the last seq of
+          // the same run is a replay duplicate; no need to scan the whole list
+          const last = prev.at(-1);
+          if (last?.runId !== parsed.runId) {
+            // Events left over from another run don't belong in this list
+            return prev.filter((e) => e.runId === parsed.runId).concat(parsed);
+          }
+          if (parsed.seq <= last.seq) {
             return prev;
           }
           return [...prev, parsed];
@@ -20,7 +20,6 @@ export const CONTEXT_HEADER_USER_ID = 'x-databricks-user-id';
 async function getProviderToken(): Promise<string> {
   // First, check if we have a PAT token
   if (process.env.DATABRICKS_TOKEN) {
-    console.log('Using PAT token from DATABRICKS_TOKEN env var');
     return process.env.DATABRICKS_TOKEN;
   }
 
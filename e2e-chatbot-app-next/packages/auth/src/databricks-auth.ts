@@ -41,10 +41,12 @@ export interface ClientSession {
 // OAuth token caching
 let oauthToken: string | null = null;
 let oauthTokenExpiresAt = 0;
+let oauthTokenRequest: Promise<string> | null = null;
 
 // CLI token caching
 let cliToken: string | null = null;
 let cliTokenExpiresAt = 0;
+let cliTokenRequest: Promise<string> | null = null;
 
 // CLI user identity caching
 let cliUserIdentity: string | null = null;
@@ -59,21 +61,29 @@ let cacheExpiry = 0;
 // Authentication Method Detection
 // ============================================================================
 
+// Auth configuration comes from env vars that are fixed for the process, so
+// resolve the method once instead of on every token and DB connection lookup
+let resolvedAuthMethod: AuthMethod | null = null;
+
 /**
  * Determine which authentication method to use
  */
 export function getAuthMethod(): AuthMethod {
-  // Check for OAuth (service principal) credentials
-  if (shouldUseOAuth()) {
-    return 'oauth';
+  if (resolvedAuthMethod) {
+    return resolvedAuthMethod;
   }
 
-  // Check for CLI-based authentication
-  if (shouldUseCLIAuth()) {
-    return 'cli';
+  // Check for OAuth (service principal) credentials
+  if (shouldUseOAuth()) {
+    resolvedAuthMethod = 'oauth';
+  } else if (shouldUseCLIAuth()) {
+    // Check for CLI-based authentication
+    resolvedAuthMethod = 'cli';
+  } else {
+    resolvedAuthMethod = 'none';
   }
 
-  return 'none';
+  return resolvedAuthMethod;
 }
 
 /**
@@ -153,6 +163,17 @@ export async function getDatabricksOAuthToken(): Promise<string> {
     return oauthToken;
   }
 
+  // Every model call asks for a token, so when it expires concurrent requests
+  // share a single refresh instead of each hitting the token endpoint
+  if (!oauthTokenRequest) {
+    oauthTokenRequest = requestDatabricksOAuthToken().finally(() => {
+      oauthTokenRequest = null;
+    });
+  }
+  return oauthTokenRequest;
+}
+
+async function requestDatabricksOAuthToken(): Promise<string> {
   const clientId = process.env.DATABRICKS_CLIENT_ID;
   const clientSecret = process.env.DATABRICKS_CLIENT_SECRET;
   const hostUrl = getHostUrl();
@@ -166,8 +187,6 @@ export async function getDatabricksOAuthToken(): Promise<string> {
   const tokenUrl = `${hostUrl.replace(/\/$/, '')}/oidc/v1/token`;
   const body = 'grant_type=client_credentials&scope=all-apis';
 
-  console.log('Buffer', Buffer);
-
   const response = await fetch(tokenUrl, {
     method: 'POST',
     headers: {
@@ -300,6 +319,16 @@ export async function getDatabricksCliToken(): Promise<string> {
     return cliToken;
   }
 
+  // Spawning the CLI is slow, so concurrent callers wait on the same refresh
+  if (!cliTokenRequest) {
+    cliTokenRequest = requestDatabricksCliToken().finally(() => {
+      cliTokenRequest = null;
+    });
+  }
+  return cliTokenRequest;
+}
+
+async function requestDatabricksCliToken(): Promise<string> {
   const { spawnWithOutput } = await import('@chat-template/utils');
 
   // Get options from environment
@@ -0,0 +1,7 @@
+CREATE INDEX IF NOT EXISTS "Message_chatId_createdAt_idx" ON "ai_chatbot"."Message" ("chatId", "createdAt");
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "Chat_userId_createdAt_idx" ON "ai_chatbot"."Chat" ("userId", "createdAt");
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "ResearchProject_userId_createdAt_idx" ON "ai_chatbot"."ResearchProject" ("userId", "createdAt");
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "ResearchRun_projectId_createdAt_idx" ON "ai_chatbot"."ResearchRun" ("projectId", "createdAt");
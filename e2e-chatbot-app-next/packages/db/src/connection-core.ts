@@ -20,9 +20,7 @@ export interface DatabaseCredentials {
  * Hardcoded to ai_chatbot for consistency with drizzle-kit generate
  */
 export function getSchemaName(): string {
-  const schemaName = 'ai_chatbot';
-  console.log(`[getSchemaName] Using hardcoded schema: ${schemaName}`);
-  return schemaName;
+  return 'ai_chatbot';
 }
 
 /**
@@ -50,9 +48,7 @@ export function getDatabaseConfigFromEnv(): DatabaseConfig | null {
  * Check if database storage is available
  */
 export function isDatabaseAvailable(): boolean {
-  const isAvailable = !!(process.env.PGDATABASE || process.env.POSTGRES_URL);
-  console.log(`[isDatabaseAvailable] Database available: ${isAvailable}`);
-  return isAvailable;
+  return !!(process.env.PGDATABASE || process.env.POSTGRES_URL);
 }
 
 /**
@@ -10,6 +10,7 @@ import { getDatabricksToken } from '@chat-template/auth';
 // Connection pool management
 let sqlConnection: postgres.Sql | null = null;
 let currentToken: string | null = null;
+let dbInstance: ReturnType<typeof drizzle<typeof schema>> | null = null;
 
 async function getConnection(): Promise<postgres.Sql> {
   const { default: postgres } = await import('postgres');
@@ -23,11 +24,15 @@ async function getConnection(): Promise<postgres.Sql> {
     await sqlConnection.end();
     sqlConnection = null;
     currentToken = null;
+    dbInstance = null;
   }
 
   // Create a new connection if needed
   if (!sqlConnection) {
     const connectionUrl = await getConnectionUrl();
+    // Pass search_path as a startup parameter so every pooled connection gets
+    // it at connect time, rather than issuing SET on one connection per query
+    const schemaName = getSchemaName();
     sqlConnection = postgres(connectionUrl, {
       max: 10, // connection pool size
       idle_timeout: 20, // close idle connections after 20 seconds
@@ -35,6 +40,9 @@ async function getConnection(): Promise<postgres.Sql> {
       // Important: Set max_lifetime to ensure connections don't outlive the token
       // OAuth tokens typically expire in 1 hour, we'll refresh connections more frequently
       max_lifetime: 60 * 10, // 10 minutes max connection lifetime
+      ...(schemaName !== 'public'
+        ? { connection: { search_path: `"${schemaName}", public` } }
+        : {}),
     });
 
     currentToken = freshToken;
@@ -44,28 +52,11 @@ async function getConnection(): Promise<postgres.Sql> {
   return sqlConnection;
 }
 
-// Export a function to get the Drizzle instance with fresh connection
+// Export a function to get the Drizzle instance for the current connection pool
 export async function getDb() {
   const sql = await getConnection();
-
-  // Set the search_path to include our custom schema
-  const schemaName = getSchemaName();
-  if (schemaName !== 'public') {
-    try {
-      await sql`SET search_path TO ${sql(schemaName)}, public`;
-      console.log(
-        `[DB Pool] Set search_path to include schema '${schemaName}'`,
-      );
-    } catch (error) {
-      const errorMessage =
-        error instanceof Error ? error.message : String(error);
-      console.error(
-        `[DB Pool] Failed to set search_path for '${schemaName}':`,
-        errorMessage,
-      );
-      // Don't throw - continue anyway
-    }
+  if (!dbInstance) {
+    dbInstance = drizzle(sql, { schema });
   }
-
-  return drizzle(sql, { schema });
+  return dbInstance;
 }
@@ -63,7 +63,16 @@ const getOrInitializeDb = async () => {
     );
   } else if (process.env.POSTGRES_URL) {
     // Traditional connection string
-    const client = postgres(process.env.POSTGRES_URL);
+    // Same size and idle settings as the OAuth pool, so a server restart on
+    // the database side doesn't leave stale sockets behind. The lifetime is
+    // longer because there is no token to rotate: the OAuth pool's 10 minutes
+    // exists only to stay ahead of token expiry
+    const client = postgres(process.env.POSTGRES_URL, {
+      max: 10,
+      idle_timeout: 20,
+      connect_timeout: 10,
+      max_lifetime: 60 * 30,
+    });
     _db = drizzle(client);
   }
 
@@ -532,23 +541,27 @@ export async function getResearchProjectsByUserId({
   return rows;
 }
 
-export async function updateResearchProject({
-  projectId,
-  status,
-  activeRunId,
-}: {
-  projectId: string;
+type ResearchProjectUpdate = {
   status?: ResearchProjectStatus;
   activeRunId?: string | null;
-}) {
+};
+
+function buildResearchProjectSet({ status, activeRunId }: ResearchProjectUpdate) {
+  return {
+    ...(status !== undefined ? { status } : {}),
+    ...(activeRunId !== undefined ? { activeRunId } : {}),
+    updatedAt: new Date(),
+  };
+}
+
+export async function updateResearchProject({
+  projectId,
+  ...update
+}: { projectId: string } & ResearchProjectUpdate) {
   requireResearchPersistence('updateResearchProject');
   const [updatedProject] = await (await ensureDb())
     .update(researchProject)
-    .set({
-      ...(status !== undefined ? { status } : {}),
-      ...(activeRunId !== undefined ? { activeRunId } : {}),
-      updatedAt: new Date(),
-    })
+    .set(buildResearchProjectSet(update))
     .where(eq(researchProject.id, projectId))
     .returning();
 
@@ -571,47 +584,42 @@ export async function createResearchPlanVersion({
   approvedAt?: Date | null;
 }): Promise<ResearchPlan | null> {
   requireResearchPersistence('createResearchPlanVersion');
-  const database = await ensureDb();
   const now = new Date();
 
-  const [latestPlan] = await database
-    .select()
-    .from(researchPlan)
-    .where(eq(researchPlan.projectId, projectId))
-    .orderBy(desc(researchPlan.version))
-    .limit(1);
-
-  const nextVersion = (latestPlan?.version ?? 0) + 1;
-
-  await database
-    .update(researchPlan)
-    .set({
-      status: 'superseded',
-      updatedAt: now,
-    })
-    .where(
-      and(
-        eq(researchPlan.projectId, projectId),
-        inArray(researchPlan.status, ['draft', 'approved']),
-      ),
-    );
+  // Supersede and insert atomically, allocating the next version inside the
+  // INSERT so concurrent syncs can't read the same latest version. This is for
+  // consistency, not latency: BEGIN and COMMIT are round trips of their own.
+  return (await ensureDb()).transaction(async (tx) => {
+    await tx
+      .update(researchPlan)
+      .set({
+        status: 'superseded',
+        updatedAt: now,
+      })
+      .where(
+        and(
+          eq(researchPlan.projectId, projectId),
+          inArray(researchPlan.status, ['draft', 'approved']),
+        ),
+      );
 
-  const [newPlan] = await database
-    .insert(researchPlan)
-    .values({
-      projectId,
-      version: nextVersion,
-      status,
-      scopeJson,
-      planJson,
-      planMarkdown,
-      approvedAt,
-      createdAt: now,
-      updatedAt: now,
-    })
-    .returning();
+    const [newPlan] = await tx
+      .insert(researchPlan)
+      .values({
+        projectId,
+        version: sql<number>`(select coalesce(max("version"), 0) + 1 from ${researchPlan} where "projectId" = ${projectId})`,
+        status,
+        scopeJson,
+        planJson,
+        planMarkdown,
+        approvedAt,
+        createdAt: now,
+        updatedAt: now,
+      })
+      .returning();
 
-  return newPlan ?? null;
+    return newPlan ?? null;
+  });
 }
 
 export async function getLatestResearchPlanByProjectId({
@@ -741,6 +749,28 @@ export async function getResearchRunById({
   return run ?? null;
 }
 
+/**
+ * Read only a run's status flags. Status polling during execution shouldn't
+ * pull the finalMarkdown report or error text along with every check.
+ */
+export async function getResearchRunStatusById({
+  runId,
+}: {
+  runId: string;
+}): Promise<Pick<ResearchRun, 'status' | 'cancellationRequested'> | null> {
+  requireResearchPersistence('getResearchRunStatusById');
+  const [run] = await (await ensureDb())
+    .select({
+      status: researchRun.status,
+      cancellationRequested: researchRun.cancellationRequested,
+    })
+    .from(researchRun)
+    .where(eq(researchRun.id, runId))
+    .limit(1);
+
+  return run ?? null;
+}
+
 export async function getLatestResearchRunByProjectId({
   projectId,
 }: {
@@ -757,64 +787,102 @@ export async function getLatestResearchRunByProjectId({
   return run ?? null;
 }
 
-export async function updateResearchRun({
-  runId,
-  status,
-  cancellationRequested,
-  finalMarkdown,
-  errorText,
-  startedAt,
-  endedAt,
-}: {
-  runId: string;
+type ResearchRunUpdate = {
   status?: ResearchRunStatus;
   cancellationRequested?: boolean;
   finalMarkdown?: string | null;
   errorText?: string | null;
   startedAt?: Date | null;
   endedAt?: Date | null;
-}): Promise<ResearchRun | null> {
+};
+
+function buildResearchRunSet({
+  status,
+  cancellationRequested,
+  finalMarkdown,
+  errorText,
+  startedAt,
+  endedAt,
+}: ResearchRunUpdate) {
+  return {
+    ...(status !== undefined ? { status } : {}),
+    ...(cancellationRequested !== undefined ? { cancellationRequested } : {}),
+    ...(finalMarkdown !== undefined ? { finalMarkdown } : {}),
+    ...(errorText !== undefined ? { errorText } : {}),
+    ...(startedAt !== undefined ? { startedAt } : {}),
+    ...(endedAt !== undefined ? { endedAt } : {}),
+    updatedAt: new Date(),
+  };
+}
+
+export async function updateResearchRun({
+  runId,
+  ...update
+}: { runId: string } & ResearchRunUpdate): Promise<ResearchRun | null> {
   requireResearchPersistence('updateResearchRun');
   const [updatedRun] = await (await ensureDb())
     .update(researchRun)
-    .set({
-      ...(status !== undefined ? { status } : {}),
-      ...(cancellationRequested !== undefined
-        ? { cancellationRequested }
-        : {}),
-      ...(finalMarkdown !== undefined ? { finalMarkdown } : {}),
-      ...(errorText !== undefined ? { errorText } : {}),
-      ...(startedAt !== undefined ? { startedAt } : {}),
-      ...(endedAt !== undefined ? { endedAt } : {}),
-      updatedAt: new Date(),
-    })
+    .set(buildResearchRunSet(update))
     .where(eq(researchRun.id, runId))
     .returning();
 
   return updatedRun ?? null;
 }
 
+/**
+ * Update a run and its project together. Run status transitions always move
+ * the project as well, so both UPDATEs go out as one statement: the run update
+ * runs as a data-modifying CTE, which Postgres applies atomically with the
+ * project update in a single round trip.
+ */
+export async function updateResearchRunAndProject({
+  runId,
+  projectId,
+  run,
+  project,
+}: {
+  runId: string;
+  projectId: string;
+  run: ResearchRunUpdate;
+  project: ResearchProjectUpdate;
+}): Promise<void> {
+  requireResearchPersistence('updateResearchRunAndProject');
+  const database = await ensureDb();
+  const runUpdate = database
+    .update(researchRun)
+    .set(buildResearchRunSet(run))
+    .where(eq(researchRun.id, runId));
+  const projectUpdate = database
+    .update(researchProject)
+    .set(buildResearchProjectSet(project))
+    .where(eq(researchProject.id, projectId));
+
+  // getSQL() embeds the builders' statements as-is; passing the builders
+  // themselves would wrap them in parentheses
+  await database.execute(
+    sql`with updated_run as (${runUpdate.getSQL()}) ${projectUpdate.getSQL()}`,
+  );
+}
+
 export async function requestResearchRunCancellation({
   runId,
 }: {
   runId: string;
 }): Promise<ResearchRun | null> {
   requireResearchPersistence('requestResearchRunCancellation');
-  const run = await getResearchRunById({ runId });
-  if (!run) {
-    return null;
-  }
-
-  const nextStatus: ResearchRunStatus =
-    run.status === 'queued' || run.status === 'running'
-      ? 'cancel_requested'
-      : run.status;
+  // Decide the next status in the UPDATE itself so a status change between a
+  // read and the write can't be overwritten, and to save the extra round trip
+  const [updatedRun] = await (await ensureDb())
+    .update(researchRun)
+    .set({
+      status: sql<ResearchRunStatus>`case when ${researchRun.status} in ('queued', 'running') then 'cancel_requested' else ${researchRun.status} end`,
+      cancellationRequested: true,
+      updatedAt: new Date(),
+    })
+    .where(eq(researchRun.id, runId))
+    .returning();
 
-  return updateResearchRun({
-    runId,
-    status: nextStatus,
-    cancellationRequested: true,
-  });
+  return updatedRun ?? null;
 }
 
 export async function appendResearchRunEvent({
@@ -831,20 +899,13 @@ export async function appendResearchRunEvent({
   payload?: Record<string, unknown>;
 }): Promise<ResearchRunEvent | null> {
   requireResearchPersistence('appendResearchRunEvent');
-  const database = await ensureDb();
-
-  const [lastEvent] = await database
-    .select()
-    .from(researchRunEvent)
-    .where(eq(researchRunEvent.runId, runId))
-    .orderBy(desc(researchRunEvent.seq))
-    .limit(1);
 
-  const [event] = await database
+  // Allocate the next seq inside the INSERT so each event costs one round trip
+  const [event] = await (await ensureDb())
     .insert(researchRunEvent)
     .values({
       runId,
-      seq: (lastEvent?.seq ?? 0) + 1,
+      seq: sql<number>`(select coalesce(max("seq"), 0) + 1 from ${researchRunEvent} where "runId" = ${runId})`,
       stage,
       level,
       message: runMessage,
@@ -19,27 +19,29 @@ export async function spawnWithOutput(
       env,
     });
 
-    let stdout = '';
-    let stderr = '';
+    // Collect raw chunks and decode once on close, rather than re-concatenating
+    // strings per chunk (which can also split multi-byte characters)
+    const stdout: Buffer[] = [];
+    const stderr: Buffer[] = [];
 
-    child.stdout?.on('data', (data) => {
-      stdout += data.toString();
+    child.stdout?.on('data', (data: Buffer) => {
+      stdout.push(data);
     });
 
-    child.stderr?.on('data', (data) => {
-      stderr += data.toString();
+    child.stderr?.on('data', (data: Buffer) => {
+      stderr.push(data);
     });
 
     child.on('close', (code) => {
       if (code !== 0) {
         reject(
           new Error(
-            `${errorMessagePrefix} (exit code ${code}): ${stderr.trim()}`,
+            `${errorMessagePrefix} (exit code ${code}): ${Buffer.concat(stderr).toString().trim()}`,
           ),
         );
         return;
       }
-      resolve(stdout.trim());
+      resolve(Buffer.concat(stdout).toString().trim());
     });
   });
 }
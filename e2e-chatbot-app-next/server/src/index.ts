@@ -9,6 +9,8 @@ import express, {
 } from 'express';
 import cors from 'cors';
 import path from 'node:path';
+import { createHash } from 'node:crypto';
+import { readFileSync } from 'node:fs';
 import { fileURLToPath } from 'node:url';
 import { dirname } from 'node:path';
 import { chatRouter } from './routes/chat';
@@ -60,11 +62,56 @@ app.use('/api/research', researchRouter);
 // Serve static files in production
 if (!isDevelopment) {
   const clientBuildPath = path.join(__dirname, '../../client/dist');
-  app.use(express.static(clientBuildPath));
+  // Vite content-hashes everything under assets/, so those files never change
+  // for a given URL and browsers can skip revalidation entirely
+  app.use(
+    '/assets',
+    express.static(path.join(clientBuildPath, 'assets'), {
+      immutable: true,
+      maxAge: '1y',
+    }),
+  );
+  app.use(
+    express.static(clientBuildPath, {
+      setHeaders: (res, filePath) => {
+        // index.html points at the current hashed bundle, so always revalidate it
+        if (filePath.endsWith('.html')) {
+          res.setHeader('Cache-Control', 'no-cache');
+        }
+      },
+    }),
+  );
+
+  // index.html is small and fixed for the lifetime of a deploy, so read it once
+  // instead of opening and streaming it from disk on every client-side route
+  let indexHtml: { body: Buffer; etag: string } | null = null;
+  const getIndexHtml = () => {
+    if (!indexHtml) {
+      const body = readFileSync(path.join(clientBuildPath, 'index.html'));
+      const digest = createHash('sha1').update(body).digest('base64url');
+      indexHtml = { body, etag: `"${digest}"` };
+    }
+    return indexHtml;
+  };
 
   // SPA fallback - serve index.html for all non-API routes
-  app.get(/^\/(?!api).*/, (_req, res) => {
-    res.sendFile(path.join(clientBuildPath, 'index.html'));
+  app.get(/^\/(?!api).*/, (_req, res, next) => {
+    try {
+      const { body, etag } = getIndexHtml();
+      // res.send answers with 304 when If-None-Match matches the ETag
+      res.set({
+        'Content-Type': 'text/html; charset=utf-8',
+        'Cache-Control': 'no-cache',
+        ETag: etag,
+      });
+      res.send(body);
+    } catch (error) {
+      // No client build: fall through to a 404 as sendFile did, not a 500
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return next();
+      }
+      next(error);
+    }
   });
 }
 
@@ -2,8 +2,8 @@ import {
   appendResearchRunEvent,
   getResearchPlanByProjectIdAndVersion,
   getResearchRunById,
-  updateResearchProject,
-  updateResearchRun,
+  getResearchRunStatusById,
+  updateResearchRunAndProject,
 } from '@chat-template/db';
 import type { ResearchRunEvent, ResearchRunStage } from '@chat-template/db';
 import {
@@ -17,27 +17,64 @@ const activeRunControllers = new Map<string, AbortController>();
 const ACTIVE_STATUSES = new Set(['queued', 'running', 'cancel_requested']);
 const TERMINAL_STATUSES = new Set(['cancelled', 'succeeded', 'failed']);
 
+const RUN_STAGES: ReadonlyArray<{
+  stage: ResearchRunStage;
+  message: string;
+  delayMs: number;
+}> = [
+  {
+    stage: 'analyzing',
+    message: 'Analyzing approved scope and research questions.',
+    delayMs: 450,
+  },
+  {
+    stage: 'researching',
+    message: 'Executing research tasks against available context.',
+    delayMs: 700,
+  },
+  {
+    stage: 'synthesizing',
+    message: 'Synthesizing findings into structured conclusions.',
+    delayMs: 650,
+  },
+  {
+    stage: 'finalizing',
+    message: 'Finalizing markdown deliverable.',
+    delayMs: 500,
+  },
+];
+
+const FINDING_ASSESSMENT =
+  '   - Assessment: Further validation and analysis completed for this question.';
+
+const NEXT_STEPS_SECTION = [
+  '## Recommended Next Steps',
+  '- Validate assumptions with domain stakeholders.',
+  '- Prioritize follow-up research questions by impact and feasibility.',
+  '- Convert key findings into execution tasks.',
+].join('\n');
+
 function buildFinalMarkdown({
   plan,
   runId,
+  completedAt,
 }: {
   plan: ResearchPlanArtifact;
   runId: string;
+  completedAt: Date;
 }) {
-  const timestamp = new Date().toISOString();
   return [
     `# Research Result: ${plan.title}`,
     '',
     `Run ID: \`${runId}\``,
-    `Completed: ${timestamp}`,
+    `Completed: ${completedAt.toISOString()}`,
     '',
     '## Objective',
     plan.objective,
     '',
     '## Findings',
     ...plan.keyQuestions.map(
-      (question, index) =>
-        `${index + 1}. ${question}\n   - Assessment: Further validation and analysis completed for this question.`,
+      (question, index) => `${index + 1}. ${question}\n${FINDING_ASSESSMENT}`,
     ),
     '',
     '## Methodology Used',
@@ -46,10 +83,7 @@ function buildFinalMarkdown({
     '## Constraints Applied',
     ...plan.constraints.map((constraint) => `- ${constraint}`),
     '',
-    '## Recommended Next Steps',
-    '- Validate assumptions with domain stakeholders.',
-    '- Prioritize follow-up research questions by impact and feasibility.',
-    '- Convert key findings into execution tasks.',
+    NEXT_STEPS_SECTION,
   ].join('\n');
 }
 
@@ -142,7 +176,7 @@ async function shouldCancelRun({
     return true;
   }
 
-  const run = await getResearchRunById({ runId });
+  const run = await getResearchRunStatusById({ runId });
   if (!run) {
     return true;
   }
@@ -161,21 +195,23 @@ async function finalizeCancelledRun({
   projectId: string;
   runId: string;
 }) {
-  const run = await getResearchRunById({ runId });
+  const run = await getResearchRunStatusById({ runId });
   if (!run || TERMINAL_STATUSES.has(run.status)) {
     return;
   }
 
-  await updateResearchRun({
+  await updateResearchRunAndProject({
     runId,
-    status: 'cancelled',
-    cancellationRequested: true,
-    endedAt: new Date(),
-  });
-  await updateResearchProject({
     projectId,
-    status: 'cancelled',
-    activeRunId: null,
+    run: {
+      status: 'cancelled',
+      cancellationRequested: true,
+      endedAt: new Date(),
+    },
+    project: {
+      status: 'cancelled',
+      activeRunId: null,
+    },
   });
   await appendAndPublishEvent({
     runId,
@@ -200,51 +236,32 @@ async function executeResearchRun({
       return;
     }
 
-    await updateResearchRun({
-      runId,
-      status: 'running',
-      startedAt: run.startedAt ?? new Date(),
-    });
-    await updateResearchProject({
-      projectId,
-      status: 'running',
-      activeRunId: runId,
-    });
-
-    const plan = await getResearchPlanByProjectIdAndVersion({
-      projectId,
-      version: run.planVersion,
-    });
+    // Marking the run as running and loading its plan are independent
+    const [, plan] = await Promise.all([
+      updateResearchRunAndProject({
+        runId,
+        projectId,
+        run: {
+          status: 'running',
+          startedAt: run.startedAt ?? new Date(),
+        },
+        project: {
+          status: 'running',
+          activeRunId: runId,
+        },
+      }),
+      getResearchPlanByProjectIdAndVersion({
+        projectId,
+        version: run.planVersion,
+      }),
+    ]);
     if (!plan) {
       throw new Error('Approved plan could not be loaded for execution.');
     }
 
     const parsedPlan = parsePlanArtifact(plan);
 
-    const stages: Array<{ stage: ResearchRunStage; message: string; delayMs: number }> = [
-      {
-        stage: 'analyzing',
-        message: 'Analyzing approved scope and research questions.',
-        delayMs: 450,
-      },
-      {
-        stage: 'researching',
-        message: 'Executing research tasks against available context.',
-        delayMs: 700,
-      },
-      {
-        stage: 'synthesizing',
-        message: 'Synthesizing findings into structured conclusions.',
-        delayMs: 650,
-      },
-      {
-        stage: 'finalizing',
-        message: 'Finalizing markdown deliverable.',
-        delayMs: 500,
-      },
-    ];
-
-    for (const stage of stages) {
+    for (const stage of RUN_STAGES) {
       if (await shouldCancelRun({ runId, signal })) {
         await finalizeCancelledRun({ projectId, runId });
         return;
@@ -263,21 +280,25 @@ async function executeResearchRun({
       return;
     }
 
+    const completedAt = new Date();
     const finalMarkdown = buildFinalMarkdown({
       plan: parsedPlan,
       runId,
+      completedAt,
     });
 
-    await updateResearchRun({
+    await updateResearchRunAndProject({
       runId,
-      status: 'succeeded',
-      finalMarkdown,
-      endedAt: new Date(),
-    });
-    await updateResearchProject({
       projectId,
-      status: 'completed',
-      activeRunId: null,
+      run: {
+        status: 'succeeded',
+        finalMarkdown,
+        endedAt: completedAt,
+      },
+      project: {
+        status: 'completed',
+        activeRunId: null,
+      },
     });
 
     await appendAndPublishEvent({
@@ -289,7 +310,14 @@ async function executeResearchRun({
       },
     });
   } catch (error) {
-    const maybeRun = await getResearchRunById({ runId });
+    // The cancel route aborts the local controller, so an abort here is a
+    // cancellation rather than a failure and needs no status lookup to tell.
+    if (signal.aborted) {
+      await finalizeCancelledRun({ projectId, runId });
+      return;
+    }
+
+    const maybeRun = await getResearchRunStatusById({ runId });
     if (!maybeRun) {
       return;
     }
@@ -297,16 +325,18 @@ async function executeResearchRun({
     if (maybeRun.status !== 'cancelled') {
       const errorMessage =
         error instanceof Error ? error.message : 'Unexpected execution error';
-      await updateResearchRun({
+      await updateResearchRunAndProject({
         runId,
-        status: 'failed',
-        errorText: errorMessage,
-        endedAt: new Date(),
-      });
-      await updateResearchProject({
         projectId,
-        status: 'failed',
-        activeRunId: null,
+        run: {
+          status: 'failed',
+          errorText: errorMessage,
+          endedAt: new Date(),
+        },
+        project: {
+          status: 'failed',
+          activeRunId: null,
+        },
       });
 
       await appendAndPublishEvent({
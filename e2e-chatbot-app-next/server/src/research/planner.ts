@@ -1,6 +1,7 @@
 import type { DBMessage } from '@chat-template/db';
 import {
   createResearchPlanVersion,
+  getLatestResearchPlanByProjectId,
   getMessagesByChatId,
   getResearchProjectByChatId,
   updateResearchProject,
@@ -10,7 +11,28 @@ import {
   type ResearchPlanArtifact,
 } from '@chat-template/core';
 
-function extractMessageText(message: DBMessage): string {
+type PlannerMessage = Pick<DBMessage, 'role' | 'parts'>;
+
+// Fixed plan sections, built once rather than on every plan sync. Readonly and
+// copied into each artifact so a caller editing one plan can't change the rest
+const PLAN_METHODOLOGY =
+  'Iterative planning, hypothesis framing, context analysis, and synthesized evidence-backed reporting.';
+const PLAN_DELIVERABLES = [
+  'A structured markdown research report',
+  'Key findings and supporting rationale',
+  'Open questions and recommended next steps',
+] as const;
+const PLAN_ASSUMPTIONS = [
+  'Scope can evolve through planner discussion before execution starts.',
+  'Findings will be synthesized from available context and reasoning.',
+] as const;
+const PLAN_ACCEPTANCE_CRITERIA = [
+  'Research question and scope are clearly articulated',
+  'Execution progress is visible by stage',
+  'Final result is delivered as markdown',
+] as const;
+
+function extractMessageText(message: PlannerMessage): string {
   if (!Array.isArray(message.parts)) {
     return '';
   }
@@ -68,7 +90,7 @@ function dedupeNonEmpty(values: string[]) {
   return Array.from(new Set(values.map((item) => item.trim()).filter(Boolean)));
 }
 
-export function buildResearchPlanArtifact(messages: DBMessage[]) {
+export function buildResearchPlanArtifact(messages: PlannerMessage[]) {
   const userTexts = messages
     .filter((message) => message.role === 'user')
     .map(extractMessageText)
@@ -81,40 +103,27 @@ export function buildResearchPlanArtifact(messages: DBMessage[]) {
   const conversationText = userTexts.join('\n');
   const firstUserText = userTexts.at(0) ?? 'New research initiative';
   const latestUserText = userTexts.at(-1) ?? firstUserText;
+  const lowerConversationText = conversationText.toLowerCase();
 
   const constraints = dedupeNonEmpty([
-    conversationText.toLowerCase().includes('deadline')
+    lowerConversationText.includes('deadline')
       ? 'Honor the timeline or deadline mentioned by the user.'
       : '',
-    conversationText.toLowerCase().includes('budget')
+    lowerConversationText.includes('budget')
       ? 'Account for budget constraints stated in scope.'
       : '',
     'Phase 1 uses no external tools; rely on provided user context.',
   ]);
 
-  const assumptions = dedupeNonEmpty([
-    'Scope can evolve through planner discussion before execution starts.',
-    'Findings will be synthesized from available context and reasoning.',
-  ]);
-
   const artifact: ResearchPlanArtifact = {
     title: normalizeTitle(firstUserText),
     objective: latestUserText,
     keyQuestions: extractQuestions(conversationText || latestUserText),
-    methodology:
-      'Iterative planning, hypothesis framing, context analysis, and synthesized evidence-backed reporting.',
-    deliverables: [
-      'A structured markdown research report',
-      'Key findings and supporting rationale',
-      'Open questions and recommended next steps',
-    ],
+    methodology: PLAN_METHODOLOGY,
+    deliverables: [...PLAN_DELIVERABLES],
     constraints,
-    assumptions,
-    acceptanceCriteria: [
-      'Research question and scope are clearly articulated',
-      'Execution progress is visible by stage',
-      'Final result is delivered as markdown',
-    ],
+    assumptions: [...PLAN_ASSUMPTIONS],
+    acceptanceCriteria: [...PLAN_ACCEPTANCE_CRITERIA],
     readyForApproval: userTexts.length > 0 && assistantTexts.length > 0,
   };
 
@@ -153,16 +162,20 @@ export function renderResearchPlanMarkdown(plan: ResearchPlanArtifact): string {
 export async function syncResearchPlanFromChat({
   chatId,
   userId,
+  messages: conversation,
 }: {
   chatId: string;
   userId: string;
+  // The caller usually already holds the full conversation; pass it to avoid
+  // reloading the whole history from the database on every turn
+  messages?: PlannerMessage[];
 }) {
   const project = await getResearchProjectByChatId({ chatId });
   if (!project || project.userId !== userId) {
     return null;
   }
 
-  const messages = await getMessagesByChatId({ id: chatId });
+  const messages = conversation ?? (await getMessagesByChatId({ id: chatId }));
   if (messages.length === 0) {
     return null;
   }
@@ -170,6 +183,24 @@ export async function syncResearchPlanFromChat({
   const plan = buildResearchPlanArtifact(messages);
   const planMarkdown = renderResearchPlanMarkdown(plan);
 
+  // The rendered markdown covers every plan field, so an identical render means
+  // this turn did not change the plan. Skip writing a new version in that case so
+  // follow-up chat turns don't churn versions or reset an approval. The project
+  // status is left alone too, on purpose: an approved project stays approved,
+  // and a completed, failed or cancelled one keeps reporting its last run while
+  // its approved plan can be run again as-is. Only a changed plan moves the
+  // project back to planning.
+  const latestPlan = await getLatestResearchPlanByProjectId({
+    projectId: project.id,
+  });
+  if (
+    latestPlan &&
+    latestPlan.status !== 'superseded' &&
+    latestPlan.planMarkdown === planMarkdown
+  ) {
+    return latestPlan;
+  }
+
   const savedPlan = await createResearchPlanVersion({
     projectId: project.id,
     scopeJson: {
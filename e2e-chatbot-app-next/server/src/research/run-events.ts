@@ -1,4 +1,5 @@
 import { EventEmitter } from 'node:events';
+import type { ServerResponse } from 'node:http';
 import type { ResearchRunEvent } from '@chat-template/db';
 
 const runEventEmitter = new EventEmitter();
@@ -8,13 +9,23 @@ function getRunChannel(runId: string) {
   return `research-run:${runId}`;
 }
 
+export function formatResearchRunEventFrame(event: ResearchRunEvent) {
+  return `data: ${JSON.stringify(event)}\n\n`;
+}
+
 export function publishResearchRunEvent(event: ResearchRunEvent) {
-  runEventEmitter.emit(getRunChannel(event.runId), event);
+  // Serialize and encode once here so every open stream for the run writes
+  // the same bytes instead of re-encoding the frame per response
+  runEventEmitter.emit(
+    getRunChannel(event.runId),
+    Buffer.from(formatResearchRunEventFrame(event)),
+    event,
+  );
 }
 
 export function subscribeResearchRunEvents(
   runId: string,
-  handler: (event: ResearchRunEvent) => void,
+  handler: (frame: Buffer, event: ResearchRunEvent) => void,
 ) {
   const channel = getRunChannel(runId);
   runEventEmitter.on(channel, handler);
@@ -23,3 +34,34 @@ export function subscribeResearchRunEvents(
     runEventEmitter.off(channel, handler);
   };
 }
+
+const HEARTBEAT_INTERVAL_MS = 15000;
+// Clients only need bytes on the wire to keep the connection open, so the
+// ping carries no payload and can be a fixed frame
+const HEARTBEAT_FRAME = Buffer.from('event: ping\ndata: {}\n\n');
+const heartbeatStreams = new Set<ServerResponse>();
+let heartbeatTimer: NodeJS.Timeout | null = null;
+
+/**
+ * Register an open SSE response for keepalive pings. All streams share one
+ * timer, which only runs while at least one stream is open.
+ */
+export function keepResearchRunStreamAlive(res: ServerResponse) {
+  heartbeatStreams.add(res);
+  if (!heartbeatTimer) {
+    heartbeatTimer = setInterval(() => {
+      for (const stream of heartbeatStreams) {
+        stream.write(HEARTBEAT_FRAME);
+      }
+    }, HEARTBEAT_INTERVAL_MS);
+    heartbeatTimer.unref();
+  }
+
+  return () => {
+    heartbeatStreams.delete(res);
+    if (heartbeatStreams.size === 0 && heartbeatTimer) {
+      clearInterval(heartbeatTimer);
+      heartbeatTimer = null;
+    }
+  };
+}
@@ -143,16 +143,15 @@ chatRouter.post('/', requireAuth, async (req: Request, res: Response) => {
       }
     }
 
-    const messagesFromDb = await getMessagesByChatId({ id });
-
     // Use previousMessages from request body when:
     // 1. Ephemeral mode (DB not available) - always use client-side messages
     // 2. Continuation request (no message) - tool results only exist client-side
+    // Only load the stored history when it will actually be used
     const useClientMessages =
       !dbAvailable || (!message && requestBody.previousMessages);
     const previousMessages = useClientMessages
       ? (requestBody.previousMessages ?? [])
-      : convertToUIMessages(messagesFromDb);
+      : convertToUIMessages(await getMessagesByChatId({ id }));
 
     // If message is provided, add it to the list and save it
     // If not (continuation/regeneration), just use previous messages
@@ -264,9 +263,10 @@ chatRouter.post('/', requireAuth, async (req: Request, res: Response) => {
         );
       },
       onFinish: async ({ responseMessage }) => {
+        // Log a summary only; pretty-printing every part of a long response
+        // blocks the event loop on a large synchronous stdout write
         console.log(
-          'Finished message stream! Saving message...',
-          JSON.stringify(responseMessage, null, 2),
+          `Finished message stream! Saving message ${responseMessage.id} (${responseMessage.parts.length} parts)...`,
         );
         await saveMessages({
           messages: [
@@ -296,6 +296,16 @@ chatRouter.post('/', requireAuth, async (req: Request, res: Response) => {
           await syncResearchPlanFromChat({
             chatId: id,
             userId: session.user.id,
+            // Client-supplied history is never persisted, so in that case let
+            // the planner read the stored conversation instead. Otherwise the
+            // in-memory list is the stored history plus this turn; a
+            // continuation updates the last assistant message in place.
+            messages: useClientMessages
+              ? undefined
+              : [
+                  ...uiMessages.filter((m) => m.id !== responseMessage.id),
+                  responseMessage,
+                ],
           });
         } catch (err) {
           console.warn('Unable to sync research plan for chat', id, err);
@@ -17,6 +17,7 @@ import {
   updateResearchProject,
   requestResearchRunCancellation,
 } from '@chat-template/db';
+import type { ResearchProject } from '@chat-template/db';
 import {
   createResearchProjectBodySchema,
   generateUUID,
@@ -33,6 +34,8 @@ import {
   startResearchRunExecution,
 } from '../research/executor';
 import {
+  formatResearchRunEventFrame,
+  keepResearchRunStreamAlive,
   publishResearchRunEvent,
   subscribeResearchRunEvents,
 } from '../research/run-events';
@@ -77,17 +80,58 @@ async function getProjectForUser({
   return { project, error: null };
 }
 
-async function buildProjectPayload(projectId: string) {
-  const project = await getResearchProjectById({ id: projectId });
-  if (!project) {
+/**
+ * Shared guard for the /projects/:id/runs/:runId routes. Resolves the caller's
+ * project and run, or writes the error response and returns null.
+ */
+async function loadRunForRequest(req: Request, res: Response) {
+  if (!ensureDatabase(res)) {
+    return null;
+  }
+
+  const session = req.session;
+  const projectId = req.params.id;
+  const runId = req.params.runId;
+
+  if (!session || !projectId || !runId) {
+    const error = new ChatSDKError('unauthorized:chat');
+    const response = error.toResponse();
+    res.status(response.status).json(response.json);
+    return null;
+  }
+
+  // The run lookup doesn't depend on the ownership check, so issue both at once
+  const [{ project, error }, run] = await Promise.all([
+    getProjectForUser({ projectId, userId: session.user.id }),
+    getResearchRunById({ runId }),
+  ]);
+  if (!project || error) {
+    const response = (error ?? new ChatSDKError('not_found:chat')).toResponse();
+    res.status(response.status).json(response.json);
     return null;
   }
 
-  const latestPlan = await getLatestResearchPlanByProjectId({ projectId });
-  const latestRun = await getLatestResearchRunByProjectId({ projectId });
-  const activeRun = project.activeRunId
-    ? await getResearchRunById({ runId: project.activeRunId })
-    : null;
+  if (!run || run.projectId !== project.id) {
+    res.status(404).json({ error: 'Run not found for this project' });
+    return null;
+  }
+
+  return { session, project, run };
+}
+
+async function buildProjectPayload(project: ResearchProject) {
+  const projectId = project.id;
+  const [latestPlan, latestRun] = await Promise.all([
+    getLatestResearchPlanByProjectId({ projectId }),
+    getLatestResearchRunByProjectId({ projectId }),
+  ]);
+  // The active run is normally the latest one, so only look it up separately
+  // when it isn't
+  const activeRun = !project.activeRunId
+    ? null
+    : latestRun?.id === project.activeRunId
+      ? latestRun
+      : await getResearchRunById({ runId: project.activeRunId });
 
   return {
     project,
@@ -184,7 +228,7 @@ researchRouter.get(
       return res.status(404).json({ error: 'Research project not found' });
     }
 
-    const payload = await buildProjectPayload(project.id);
+    const payload = await buildProjectPayload(project);
     return res.status(200).json(payload);
   },
 );
@@ -214,7 +258,7 @@ researchRouter.get(
       return res.status(response.status).json(response.json);
     }
 
-    const payload = await buildProjectPayload(project.id);
+    const payload = await buildProjectPayload(project);
     return res.status(200).json(payload);
   },
 );
@@ -385,33 +429,11 @@ researchRouter.post(
   '/projects/:id/runs/:runId/cancel',
   requireAuth,
   async (req: Request, res: Response) => {
-    if (!ensureDatabase(res)) {
+    const loaded = await loadRunForRequest(req, res);
+    if (!loaded) {
       return;
     }
-
-    const session = req.session;
-    const projectId = req.params.id;
-    const runId = req.params.runId;
-
-    if (!session || !projectId || !runId) {
-      const error = new ChatSDKError('unauthorized:chat');
-      const response = error.toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const { project, error } = await getProjectForUser({
-      projectId,
-      userId: session.user.id,
-    });
-    if (!project || error) {
-      const response = (error ?? new ChatSDKError('not_found:chat')).toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const run = await getResearchRunById({ runId });
-    if (!run || run.projectId !== project.id) {
-      return res.status(404).json({ error: 'Run not found for this project' });
-    }
+    const runId = loaded.run.id;
 
     const updatedRun = await requestResearchRunCancellation({ runId });
     cancelResearchRunExecution(runId);
@@ -426,33 +448,11 @@ researchRouter.get(
   '/projects/:id/runs/:runId/events',
   requireAuth,
   async (req: Request, res: Response) => {
-    if (!ensureDatabase(res)) {
+    const loaded = await loadRunForRequest(req, res);
+    if (!loaded) {
       return;
     }
-
-    const session = req.session;
-    const projectId = req.params.id;
-    const runId = req.params.runId;
-
-    if (!session || !projectId || !runId) {
-      const error = new ChatSDKError('unauthorized:chat');
-      const response = error.toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const { project, error } = await getProjectForUser({
-      projectId,
-      userId: session.user.id,
-    });
-    if (!project || error) {
-      const response = (error ?? new ChatSDKError('not_found:chat')).toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const run = await getResearchRunById({ runId });
-    if (!run || run.projectId !== project.id) {
-      return res.status(404).json({ error: 'Run not found for this project' });
-    }
+    const runId = loaded.run.id;
 
     const parsedQuery = researchRunEventsQuerySchema.safeParse(req.query ?? {});
     if (!parsedQuery.success) {
@@ -471,33 +471,11 @@ researchRouter.get(
   '/projects/:id/runs/:runId/events/stream',
   requireAuth,
   async (req: Request, res: Response) => {
-    if (!ensureDatabase(res)) {
+    const loaded = await loadRunForRequest(req, res);
+    if (!loaded) {
       return;
     }
-
-    const session = req.session;
-    const projectId = req.params.id;
-    const runId = req.params.runId;
-
-    if (!session || !projectId || !runId) {
-      const error = new ChatSDKError('unauthorized:chat');
-      const response = error.toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const { project, error } = await getProjectForUser({
-      projectId,
-      userId: session.user.id,
-    });
-    if (!project || error) {
-      const response = (error ?? new ChatSDKError('not_found:chat')).toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const run = await getResearchRunById({ runId });
-    if (!run || run.projectId !== project.id) {
-      return res.status(404).json({ error: 'Run not found for this project' });
-    }
+    const runId = loaded.run.id;
 
     const parsedQuery = researchRunEventsQuerySchema.safeParse(req.query ?? {});
     if (!parsedQuery.success) {
@@ -515,21 +493,20 @@ researchRouter.get(
       runId,
       afterSeq,
     });
-    for (const event of existingEvents) {
-      res.write(`data: ${JSON.stringify(event)}\n\n`);
+    // Replay the backlog as one chunk rather than one socket write per event
+    if (existingEvents.length > 0) {
+      res.write(existingEvents.map(formatResearchRunEventFrame).join(''));
     }
 
-    const unsubscribe = subscribeResearchRunEvents(runId, (event) => {
-      res.write(`data: ${JSON.stringify(event)}\n\n`);
+    const unsubscribe = subscribeResearchRunEvents(runId, (frame) => {
+      res.write(frame);
     });
 
-    const ping = setInterval(() => {
-      res.write(`event: ping\ndata: ${Date.now()}\n\n`);
-    }, 15000);
+    const stopHeartbeat = keepResearchRunStreamAlive(res);
 
     req.on('close', () => {
       unsubscribe();
-      clearInterval(ping);
+      stopHeartbeat();
       res.end();
     });
   },
@@ -539,43 +516,35 @@ researchRouter.get(
   '/projects/:id/runs/:runId/result',
   requireAuth,
   async (req: Request, res: Response) => {
-    if (!ensureDatabase(res)) {
+    const loaded = await loadRunForRequest(req, res);
+    if (!loaded) {
       return;
     }
-
-    const session = req.session;
-    const projectId = req.params.id;
-    const runId = req.params.runId;
-
-    if (!session || !projectId || !runId) {
-      const error = new ChatSDKError('unauthorized:chat');
-      const response = error.toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const { project, error } = await getProjectForUser({
-      projectId,
-      userId: session.user.id,
-    });
-    if (!project || error) {
-      const response = (error ?? new ChatSDKError('not_found:chat')).toResponse();
-      return res.status(response.status).json(response.json);
-    }
-
-    const run = await getResearchRunById({ runId });
-    if (!run || run.projectId !== project.id) {
-      return res.status(404).json({ error: 'Run not found for this project' });
-    }
+    const { project, run } = loaded;
 
     const plan = await getResearchPlanByProjectIdAndVersion({
       projectId: project.id,
       version: run.planVersion,
     });
 
+    // Pollers re-request this until the run finishes; the rows' updatedAt
+    // stamps change whenever the payload would, so a match skips serializing
+    // and resending the report
+    res.set({
+      ETag: `"${run.id}-${run.updatedAt.getTime()}-${plan?.updatedAt.getTime() ?? 0}"`,
+      'Cache-Control': 'private, no-cache',
+    });
+    if (req.fresh) {
+      return res.status(304).end();
+    }
+
+    // The report can be large, so send it once as resultMarkdown rather than
+    // also inside the serialized run
+    const { finalMarkdown, ...runSummary } = run;
     return res.status(200).json({
-      run,
+      run: runSummary,
       plan,
-      resultMarkdown: run.finalMarkdown,
+      resultMarkdown: finalMarkdown,
     });
   },
 );
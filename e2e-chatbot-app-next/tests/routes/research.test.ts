@@ -2,6 +2,7 @@ import { expect, test } from '../fixtures';
 import { TEST_PROMPTS } from '../prompts/routes';
 import { skipInEphemeralMode, skipInWithDatabaseMode } from '../helpers';
 import type { APIRequestContext } from '@playwright/test';
+import { generateUUID } from '@chat-template/core';
 
 async function waitForRunToComplete({
   request,
@@ -34,6 +35,31 @@ async function waitForRunToComplete({
   throw new Error('Timed out waiting for run completion');
 }
 
+async function createProjectWithPlan(request: APIRequestContext) {
+  const createResponse = await request.post('/api/research/projects', {
+    data: {},
+  });
+  expect(createResponse.status()).toBe(201);
+  const createPayload = await createResponse.json();
+  const projectId = createPayload.project.id as string;
+  const chatId = createPayload.chat.id as string;
+
+  // A fresh message id per project, since message ids are global primary keys
+  const userMessage = { ...TEST_PROMPTS.SKY.MESSAGE, id: generateUUID() };
+  const chatResponse = await request.post('/api/chat', {
+    data: {
+      id: chatId,
+      message: userMessage,
+      selectedChatModel: 'chat-model',
+      selectedVisibilityType: 'private',
+    },
+  });
+  expect(chatResponse.status()).toBe(200);
+  await chatResponse.text();
+
+  return { projectId, chatId, userMessage };
+}
+
 test.describe('/api/research (with database)', () => {
   skipInEphemeralMode(test);
 
@@ -95,6 +121,107 @@ test.describe('/api/research (with database)', () => {
     expect(resultPayload.resultMarkdown).toContain('# Research Result');
   });
 
+  test('Run result supports conditional requests until the run changes', async ({
+    adaContext,
+  }) => {
+    const { projectId } = await createProjectWithPlan(adaContext.request);
+
+    const approveResponse = await adaContext.request.post(
+      `/api/research/projects/${projectId}/plan/approve`,
+    );
+    expect(approveResponse.status()).toBe(200);
+
+    const runResponse = await adaContext.request.post(
+      `/api/research/projects/${projectId}/runs`,
+    );
+    expect(runResponse.status()).toBe(202);
+    const runId = (await runResponse.json()).run.id as string;
+    const resultUrl = `/api/research/projects/${projectId}/runs/${runId}/result`;
+
+    const initialResponse = await adaContext.request.get(resultUrl);
+    expect(initialResponse.status()).toBe(200);
+    const initialEtag = initialResponse.headers().etag;
+    expect(initialEtag).toBeTruthy();
+
+    await waitForRunToComplete({
+      request: adaContext.request,
+      projectId,
+      runId,
+    });
+
+    // The run moved to a terminal status, so the old validator is stale
+    const changedResponse = await adaContext.request.get(resultUrl, {
+      headers: { 'If-None-Match': initialEtag },
+    });
+    expect(changedResponse.status()).toBe(200);
+    const completedEtag = changedResponse.headers().etag;
+    expect(completedEtag).toBeTruthy();
+    expect(completedEtag).not.toBe(initialEtag);
+    const changedPayload = await changedResponse.json();
+    expect(changedPayload.run.status).toBe('succeeded');
+
+    // Nothing changes once the run is finished
+    const unchangedResponse = await adaContext.request.get(resultUrl, {
+      headers: { 'If-None-Match': completedEtag },
+    });
+    expect(unchangedResponse.status()).toBe(304);
+    expect(await unchangedResponse.body()).toHaveLength(0);
+  });
+
+  test('Follow-up turn with an unchanged plan keeps the approved version', async ({
+    adaContext,
+  }) => {
+    const { projectId, chatId, userMessage } = await createProjectWithPlan(
+      adaContext.request,
+    );
+
+    const approveResponse = await adaContext.request.post(
+      `/api/research/projects/${projectId}/plan/approve`,
+    );
+    expect(approveResponse.status()).toBe(200);
+    const approvedPlan = (await approveResponse.json()).plan;
+    expect(approvedPlan.status).toBe('approved');
+
+    // A continuation re-runs the model without a new user message, so the
+    // derived plan renders identically
+    const followUpResponse = await adaContext.request.post('/api/chat', {
+      data: {
+        id: chatId,
+        selectedChatModel: 'chat-model',
+        selectedVisibilityType: 'private',
+        previousMessages: [
+          {
+            id: userMessage.id,
+            role: 'user',
+            parts: userMessage.parts,
+          },
+          {
+            id: generateUUID(),
+            role: 'assistant',
+            parts: [
+              {
+                type: 'text',
+                text: TEST_PROMPTS.SKY.OUTPUT_STREAM.expectedText,
+              },
+            ],
+          },
+        ],
+      },
+    });
+    expect(followUpResponse.status()).toBe(200);
+    await followUpResponse.text();
+
+    const planResponse = await adaContext.request.get(
+      `/api/research/projects/${projectId}/plan`,
+    );
+    expect(planResponse.status()).toBe(200);
+    const planPayload = await planResponse.json();
+    expect(planPayload.plan.id).toBe(approvedPlan.id);
+    expect(planPayload.plan.version).toBe(approvedPlan.version);
+    expect(planPayload.plan.status).toBe('approved');
+    expect(planPayload.projectStatus).toBe('approved');
+  });
+
   test("User cannot access another user's project", async ({
     adaContext,
     babbageContext,
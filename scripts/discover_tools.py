@@ -11,16 +11,21 @@ This script scans for:
 - External MCP servers (via Unity Catalog connections)
 """
 
+from __future__ import annotations
+
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
-from databricks.sdk import WorkspaceClient
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
 
 DEFAULT_MAX_RESULTS = 100
 DEFAULT_MAX_SCHEMAS = 25
+MAX_SCHEMA_WORKERS = 8
 
 def run_databricks_cli(args: List[str]) -> str:
     """Run databricks CLI command and return output."""
@@ -37,6 +42,17 @@ def run_databricks_cli(args: List[str]) -> str:
         return ""
 
 
+def list_per_schema(
+    schemas: List[Tuple[str, str]],
+    list_schema: Callable[[str, str], List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """List each (catalog, schema) pair on a small thread pool, keeping results in schema order."""
+    if not schemas:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(schemas), MAX_SCHEMA_WORKERS)) as executor:
+        return [item for items in executor.map(lambda pair: list_schema(*pair), schemas) for item in items]
+
+
 def discover_uc_functions(w: WorkspaceClient, catalog: str = None, max_schemas: int = DEFAULT_MAX_SCHEMAS) -> List[Dict[str, Any]]:
     """Discover Unity Catalog functions that could be used as tools.
 
@@ -46,43 +62,44 @@ def discover_uc_functions(w: WorkspaceClient, catalog: str = None, max_schemas:
         max_schemas: Total number of schemas to search across all catalogs
     """
     functions = []
-    schemas_searched = 0
+
+    def list_schema_functions(cat: str, sch: str) -> List[Dict[str, Any]]:
+        try:
+            funcs = list(w.functions.list(catalog_name=cat, schema_name=sch))
+        except Exception as e:
+            # Skip schemas we can't access
+            return []
+        return [
+            {
+                "type": "uc_function",
+                "name": func.full_name,
+                "catalog": cat,
+                "schema": sch,
+                "function_name": func.name,
+                "comment": func.comment,
+                "routine_definition": getattr(func, "routine_definition", None),
+            }
+            for func in funcs
+        ]
 
     try:
         catalogs = [catalog] if catalog else [c.name for c in w.catalogs.list()]
+        schemas = []
 
         for cat in catalogs:
-            if schemas_searched >= max_schemas:
+            if len(schemas) >= max_schemas:
                 break
 
             try:
                 all_schemas = list(w.schemas.list(catalog_name=cat))
                 # Take schemas from this catalog until we hit the global budget
-                schemas_to_search = all_schemas[:max_schemas - schemas_searched]
-
-                for schema in schemas_to_search:
-                    schema_name = f"{cat}.{schema.name}"
-                    try:
-                        funcs = list(w.functions.list(catalog_name=cat, schema_name=schema.name))
-                        for func in funcs:
-                            functions.append({
-                                "type": "uc_function",
-                                "name": func.full_name,
-                                "catalog": cat,
-                                "schema": schema.name,
-                                "function_name": func.name,
-                                "comment": func.comment,
-                                "routine_definition": getattr(func, "routine_definition", None),
-                            })
-                    except Exception as e:
-                        # Skip schemas we can't access
-                        continue
-                    finally:
-                        schemas_searched += 1
+                schemas.extend((cat, schema.name) for schema in all_schemas[:max_schemas - len(schemas)])
             except Exception as e:
                 # Skip catalogs we can't access
                 continue
 
+        functions = list_per_schema(schemas, list_schema_functions)
+
     except Exception as e:
         print(f"Error discovering UC functions: {e}", file=sys.stderr)
 
@@ -99,16 +116,45 @@ def discover_uc_tables(w: WorkspaceClient, catalog: str = None, schema: str = No
         max_schemas: Total number of schemas to search across all catalogs
     """
     tables = []
-    schemas_searched = 0
+
+    def list_schema_tables(cat: str, sch: str) -> List[Dict[str, Any]]:
+        try:
+            tbls = list(w.tables.list(catalog_name=cat, schema_name=sch))
+        except Exception as e:
+            # Skip schemas we can't access
+            return []
+
+        found = []
+        for tbl in tbls:
+            # Get column info
+            columns = []
+            if hasattr(tbl, "columns") and tbl.columns:
+                columns = [
+                    {"name": col.name, "type": col.type_name.value if hasattr(col.type_name, "value") else str(col.type_name)}
+                    for col in tbl.columns
+                ]
+
+            found.append({
+                "type": "uc_table",
+                "name": tbl.full_name,
+                "catalog": cat,
+                "schema": sch,
+                "table_name": tbl.name,
+                "table_type": tbl.table_type.value if tbl.table_type else None,
+                "comment": tbl.comment,
+                "columns": columns,
+            })
+        return found
 
     try:
         catalogs = [catalog] if catalog else [c.name for c in w.catalogs.list()]
+        schemas = []
 
         for cat in catalogs:
             if cat in ["__databricks_internal", "system"]:
                 continue
 
-            if schemas_searched >= max_schemas:
+            if len(schemas) >= max_schemas:
                 break
 
             try:
@@ -117,43 +163,19 @@ def discover_uc_tables(w: WorkspaceClient, catalog: str = None, schema: str = No
                 else:
                     all_schemas = [s.name for s in w.schemas.list(catalog_name=cat)]
                     # Take schemas from this catalog until we hit the global budget
-                    schemas_to_search = all_schemas[:max_schemas - schemas_searched]
-
-                for sch in schemas_to_search:
-                    if sch == "information_schema":
-                        schemas_searched += 1
-                        continue
-
-                    try:
-                        tbls = list(w.tables.list(catalog_name=cat, schema_name=sch))
-                        for tbl in tbls:
-                            # Get column info
-                            columns = []
-                            if hasattr(tbl, "columns") and tbl.columns:
-                                columns = [
-                                    {"name": col.name, "type": col.type_name.value if hasattr(col.type_name, "value") else str(col.type_name)}
-                                    for col in tbl.columns
-                                ]
-
-                            tables.append({
-                                "type": "uc_table",
-                                "name": tbl.full_name,
-                                "catalog": cat,
-                                "schema": sch,
-                                "table_name": tbl.name,
-                                "table_type": tbl.table_type.value if tbl.table_type else None,
-                                "comment": tbl.comment,
-                                "columns": columns,
-                            })
-                    except Exception as e:
-                        # Skip schemas we can't access
-                        pass
-                    finally:
-                        schemas_searched += 1
+                    schemas_to_search = all_schemas[:max_schemas - len(schemas)]
+
+                schemas.extend((cat, sch) for sch in schemas_to_search)
             except Exception as e:
                 # Skip catalogs we can't access
                 continue
 
+        # information_schema still counts toward the budget, it just isn't listed
+        tables = list_per_schema(
+            [(cat, sch) for cat, sch in schemas if sch != "information_schema"],
+            list_schema_tables,
+        )
+
     except Exception as e:
         print(f"Error discovering UC tables: {e}", file=sys.stderr)
 
@@ -378,32 +400,31 @@ def main():
     print("Discovering available tools and data sources...", file=sys.stderr)
 
     # Initialize Databricks workspace client
+    # Imported here so argument errors and --help don't pay for loading the SDK
+    from databricks.sdk import WorkspaceClient
+
     # Only pass profile if specified, otherwise use default
     if args.profile:
         w = WorkspaceClient(profile=args.profile)
     else:
         w = WorkspaceClient()
 
-    results = {}
-
-    # Discover each type with configurable limits
-    print("- UC Functions...", file=sys.stderr)
-    results["uc_functions"] = discover_uc_functions(w, catalog=args.catalog, max_schemas=args.max_schemas)[:args.max_results]
-
-    print("- UC Tables...", file=sys.stderr)
-    results["uc_tables"] = discover_uc_tables(w, catalog=args.catalog, schema=args.schema, max_schemas=args.max_schemas)[:args.max_results]
-
-    print("- Vector Search Indexes...", file=sys.stderr)
-    results["vector_search_indexes"] = discover_vector_search_indexes(w)[:args.max_results]
-
-    print("- Genie Spaces...", file=sys.stderr)
-    results["genie_spaces"] = discover_genie_spaces(w)[:args.max_results]
-
-    print("- Custom MCP Servers (Apps)...", file=sys.stderr)
-    results["custom_mcp_servers"] = discover_custom_mcp_servers(w)[:args.max_results]
-
-    print("- External MCP Servers (Connections)...", file=sys.stderr)
-    results["external_mcp_servers"] = discover_external_mcp_servers(w)[:args.max_results]
+    # Each resource type is an independent set of blocking REST calls, so run them concurrently
+    discoveries = {
+        "uc_functions": ("UC Functions", lambda: discover_uc_functions(w, catalog=args.catalog, max_schemas=args.max_schemas)),
+        "uc_tables": ("UC Tables", lambda: discover_uc_tables(w, catalog=args.catalog, schema=args.schema, max_schemas=args.max_schemas)),
+        "vector_search_indexes": ("Vector Search Indexes", lambda: discover_vector_search_indexes(w)),
+        "genie_spaces": ("Genie Spaces", lambda: discover_genie_spaces(w)),
+        "custom_mcp_servers": ("Custom MCP Servers (Apps)", lambda: discover_custom_mcp_servers(w)),
+        "external_mcp_servers": ("External MCP Servers (Connections)", lambda: discover_external_mcp_servers(w)),
+    }
+
+    with ThreadPoolExecutor(max_workers=len(discoveries)) as executor:
+        futures = {}
+        for key, (label, discover) in discoveries.items():
+            print(f"- {label}...", file=sys.stderr)
+            futures[key] = executor.submit(discover)
+        results = {key: future.result()[:args.max_results] for key, future in futures.items()}
 
     # Format output
     if args.format == "json":
@@ -26,9 +26,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Readiness patterns
-BACKEND_READY = [r"Uvicorn running on", r"Application startup complete", r"Started server process"]
-FRONTEND_READY = [r"Server is running on http://localhost"]
+# Readiness patterns, compiled once since every line of child output is checked against them
+BACKEND_READY = re.compile(
+    r"Uvicorn running on|Application startup complete|Started server process", re.IGNORECASE
+)
+FRONTEND_READY = re.compile(r"Server is running on http://localhost", re.IGNORECASE)
 
 
 class ProcessManager:
@@ -42,7 +44,7 @@ class ProcessManager:
         self.frontend_log = None
         self.port = port
 
-    def monitor_process(self, process, name, log_file, patterns):
+    def monitor_process(self, process, name, log_file, ready_pattern):
         is_ready = False
         try:
             for line in iter(process.stdout.readline, ""):
@@ -54,7 +56,7 @@ class ProcessManager:
                 print(f"[{name}] {line}")
 
                 # Check readiness
-                if not is_ready and any(re.search(p, line, re.IGNORECASE) for p in patterns):
+                if not is_ready and ready_pattern.search(line):
                     is_ready = True
                     if name == "backend":
                         self.backend_ready = True
@@ -110,14 +112,14 @@ class ProcessManager:
         shutil.rmtree("temp-app-templates", ignore_errors=True)
         return True
 
-    def start_process(self, cmd, name, log_file, patterns, cwd=None):
+    def start_process(self, cmd, name, log_file, ready_pattern, cwd=None):
         print(f"Starting {name}...")
         process = subprocess.Popen(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, cwd=cwd
         )
 
         thread = threading.Thread(
-            target=self.monitor_process, args=(process, name, log_file, patterns), daemon=True
+            target=self.monitor_process, args=(process, name, log_file, ready_pattern), daemon=True
         )
         thread.start()
         return process
@@ -164,8 +166,14 @@ class ProcessManager:
         self.frontend_log = open("frontend.log", "w", buffering=1)
 
         try:
-            # Build backend command, passing through all arguments
-            backend_cmd = ["uv", "run", "start-server"]
+            # Build backend command, passing through all arguments. start-app already runs
+            # inside the project environment, so reuse its interpreter instead of paying for
+            # another `uv run` resolve before the server starts
+            backend_cmd = [
+                sys.executable,
+                "-c",
+                "from agent_server.start_server import main; main()",
+            ]
             if backend_args:
                 backend_cmd.extend(backend_args)
 
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import time
+
+import anyio
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, METHOD_NOT_FOUND, ErrorData
+
+from agent_server import mcp_session
+from agent_server.mcp_session import SharedMcpServer, is_mcp_session_error
+
+
+def mcp_error(code: int) -> McpError:
+    return McpError(ErrorData(code=code, message="error"))
+
+
+def chained(error: BaseException, cause: BaseException) -> BaseException:
+    error.__cause__ = cause
+    return error
+
+
+class FakeSession:
+    def __init__(self):
+        self.alive = True
+
+    async def send_ping(self):
+        if not self.alive:
+            raise httpx.ReadError("session expired")
+
+
+class FakeServer:
+    def __init__(self):
+        self.session = FakeSession()
+        self.entered = False
+        self.exited = False
+        self.hang_on_exit = False
+
+    async def __aenter__(self):
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.hang_on_exit:
+            await asyncio.Event().wait()
+        self.exited = True
+
+
+class FakeServerFactory:
+    def __init__(self):
+        self.servers: list[FakeServer] = []
+
+    async def __call__(self) -> FakeServer:
+        server = FakeServer()
+        self.servers.append(server)
+        return server
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.ConnectError("connection refused"),
+        anyio.ClosedResourceError(),
+        ConnectionResetError(),
+        mcp_error(CONNECTION_CLOSED),
+        chained(RuntimeError("Error invoking MCP tool"), httpx.ReadError("dropped")),
+        ExceptionGroup("task group", [ValueError("unrelated"), anyio.BrokenResourceError()]),
+        chained(RuntimeError("wrapped"), ExceptionGroup("task group", [anyio.EndOfStream()])),
+    ],
+)
+def test_session_errors_are_detected(error):
+    assert is_mcp_session_error(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        RuntimeError("429 Too Many Requests"),
+        ValueError("max turns exceeded"),
+        mcp_error(INVALID_PARAMS),
+        mcp_error(METHOD_NOT_FOUND),
+        chained(RuntimeError("Error invoking MCP tool"), mcp_error(INVALID_PARAMS)),
+        ExceptionGroup("task group", [ValueError("unrelated")]),
+    ],
+)
+def test_turn_errors_are_not_session_errors(error):
+    assert not is_mcp_session_error(error)
+
+
+def test_context_chain_is_followed():
+    try:
+        try:
+            raise httpx.RemoteProtocolError("peer closed connection")
+        except httpx.RemoteProtocolError:
+            raise RuntimeError("tool call failed")
+    except RuntimeError as e:
+        assert is_mcp_session_error(e)
+
+
+def test_cyclic_chain_terminates():
+    first, second = RuntimeError("first"), RuntimeError("second")
+    first.__cause__, second.__cause__ = second, first
+    assert not is_mcp_session_error(first)
+
+
+def test_get_reuses_the_open_session():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        first = await shared.get()
+        second = await shared.get()
+        await shared.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert len(factory.servers) == 1
+    assert first.exited
+
+
+def test_concurrent_first_requests_open_one_session():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        servers = await asyncio.gather(*(shared.get() for _ in range(5)))
+        await shared.close()
+        return servers
+
+    servers = asyncio.run(run())
+    assert len(factory.servers) == 1
+    assert all(server is servers[0] for server in servers)
+
+
+def test_reset_reconnects_on_next_get():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        first = await shared.get()
+        await shared.reset(first)
+        second = await shared.get()
+        await shared.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.exited
+    assert second is not first
+    assert len(factory.servers) == 2
+
+
+def test_reset_with_a_replaced_server_is_a_no_op():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        stale = await shared.get()
+        await shared.reset(stale)
+        current = await shared.get()
+        # A second request that failed on the old session must not tear down the new one
+        await shared.reset(stale)
+        still_current = await shared.get()
+        await shared.close()
+        return current, still_current
+
+    current, still_current = asyncio.run(run())
+    assert still_current is current
+    assert len(factory.servers) == 2
+
+
+def test_idle_session_is_pinged_and_kept_when_alive():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        first = await shared.get()
+        shared._last_used = time.monotonic() - mcp_session.MCP_IDLE_CHECK_SECONDS - 1
+        second = await shared.get()
+        await shared.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert second is first
+    assert len(factory.servers) == 1
+
+
+def test_idle_session_is_replaced_when_ping_fails():
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        first = await shared.get()
+        first.session.alive = False
+        shared._last_used = time.monotonic() - mcp_session.MCP_IDLE_CHECK_SECONDS - 1
+        second = await shared.get()
+        await shared.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.exited
+    assert second is not first
+    assert len(factory.servers) == 2
+
+
+def test_cancelled_open_closes_quietly(caplog):
+    factory = FakeServerFactory()
+
+    async def run():
+        release = asyncio.Event()
+
+        async def slow_init():
+            await release.wait()
+            return await factory()
+
+        shared = SharedMcpServer(slow_init)
+        request = asyncio.create_task(shared.get())
+        await asyncio.sleep(0)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        release.set()
+        # Let the holder finish connecting and notice nobody is waiting
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(run())
+    assert len(factory.servers) == 1
+    assert factory.servers[0].exited
+    assert "Error closing MCP server" not in caplog.text
+
+
+def test_hung_close_times_out(monkeypatch, caplog):
+    monkeypatch.setattr(mcp_session, "MCP_CLOSE_TIMEOUT_SECONDS", 0.01)
+    factory = FakeServerFactory()
+    shared = SharedMcpServer(factory)
+
+    async def run():
+        server = await shared.get()
+        server.hang_on_exit = True
+        await shared.reset(server)
+        replacement = await shared.get()
+        await shared.close()
+        return replacement
+
+    with caplog.at_level(logging.WARNING):
+        replacement = asyncio.run(run())
+    assert "Timed out closing MCP server" in caplog.text
+    assert replacement is factory.servers[1]